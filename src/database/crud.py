@@ -1,13 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, RowMapping
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql import func
 from . import models
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 
 # Restaurant CRUD operations
-def create_restaurant(db: Session, restaurant_data: Dict[str, Any]) -> models.Restaurant:
+def create_restaurant(
+    db: Session, 
+    restaurant_data: Dict[str, Any],
+    refresh: bool = False,
+    autocommit: bool = True
+) -> models.Restaurant:
     db_restaurant = models.Restaurant(**restaurant_data)
     db.add(db_restaurant)
-    db.commit()
-    db.refresh(db_restaurant)
+    if autocommit:
+        db.commit()
+    else:
+        # Flush so the id is assigned while leaving the commit to the caller
+        db.flush()
+    if refresh:
+        db.refresh(db_restaurant)
     return db_restaurant
 
 def get_restaurant(db: Session, restaurant_id: int) -> Optional[models.Restaurant]:
@@ -19,6 +32,16 @@ def get_restaurant_by_name(db: Session, name: str) -> Optional[models.Restaurant
 def get_restaurant_by_address(db: Session, address: str) -> Optional[models.Restaurant]:
     return db.query(models.Restaurant).filter(models.Restaurant.address == address).first()
 
+def get_restaurant_ids_by_addresses(db: Session, addresses: List[str]) -> Dict[str, int]:
+    """Map each address that already exists to its restaurant id in a single query."""
+    unique_addresses = set(addresses)
+    if not unique_addresses:
+        return {}
+    rows = db.query(models.Restaurant.id, models.Restaurant.address).filter(
+        models.Restaurant.address.in_(unique_addresses)
+    ).all()
+    return {address: restaurant_id for restaurant_id, address in rows}
+
 def get_restaurants(
     db: Session, 
     skip: int = 0, 
@@ -26,19 +49,53 @@ def get_restaurants(
 ) -> List[models.Restaurant]:
     return db.query(models.Restaurant).offset(skip).limit(limit).all()
 
+def list_restaurants_fast(
+    db: Session, 
+    skip: int = 0, 
+    limit: int = 100
+) -> Sequence[RowMapping]:
+    """List restaurants as plain row mappings, skipping ORM object construction for read-only callers."""
+    stmt = select(models.Restaurant.__table__).offset(skip).limit(limit)
+    return db.execute(stmt).mappings().all()
+
 def update_restaurant(
     db: Session, 
     restaurant_id: int, 
-    restaurant_data: Dict[str, Any]
+    restaurant_data: Dict[str, Any],
+    refresh: bool = False,
+    autocommit: bool = True
 ) -> Optional[models.Restaurant]:
     db_restaurant = get_restaurant(db, restaurant_id)
     if db_restaurant:
         for key, value in restaurant_data.items():
             setattr(db_restaurant, key, value)
-        db.commit()
-        db.refresh(db_restaurant)
+        if autocommit:
+            db.commit()
+        else:
+            # Flush so later queries in the caller's transaction see the change
+            db.flush()
+        if refresh:
+            db.refresh(db_restaurant)
     return db_restaurant
 
+def bulk_create_restaurants(db: Session, restaurants_data: List[Dict[str, Any]]) -> None:
+    """Insert new restaurants with a single executemany, batched into multi-row INSERTs by SQLAlchemy."""
+    if not restaurants_data:
+        return
+    db.execute(insert(models.Restaurant), restaurants_data)
+    db.commit()
+
+def bulk_upsert_restaurants(db: Session, restaurants_data: List[Dict[str, Any]]) -> None:
+    """Insert restaurants in a single statement, updating any that already exist at the same address."""
+    if not restaurants_data:
+        return
+    stmt = sqlite_insert(models.Restaurant).values(restaurants_data)
+    update_columns = {c: stmt.excluded[c] for c in ('name', 'description', 'source', 'source_url')}
+    update_columns['updated_at'] = func.current_timestamp()
+    stmt = stmt.on_conflict_do_update(index_elements=['address'], set_=update_columns)
+    db.execute(stmt)
+    db.commit()
+
 def delete_restaurant(db: Session, restaurant_id: int) -> bool:
     db_restaurant = get_restaurant(db, restaurant_id)
     if db_restaurant:
@@ -51,7 +108,8 @@ def delete_restaurant(db: Session, restaurant_id: int) -> bool:
 def create_llm_info(
     db: Session, 
     restaurant_id: int, 
-    llm_info_data: Dict[str, Any]
+    llm_info_data: Dict[str, Any],
+    refresh: bool = False
 ) -> models.RestaurantLLMInfo:
     # Ensure restaurant exists
     if not get_restaurant(db, restaurant_id):
@@ -60,14 +118,15 @@ def create_llm_info(
     # Check if LLM info already exists
     existing_info = get_llm_info(db, restaurant_id)
     if existing_info:
-        return update_llm_info(db, restaurant_id, llm_info_data)
+        return update_llm_info(db, restaurant_id, llm_info_data, refresh=refresh)
     
     # Create new LLM info
     llm_info_data['restaurant_id'] = restaurant_id
     db_llm_info = models.RestaurantLLMInfo(**llm_info_data)
     db.add(db_llm_info)
     db.commit()
-    db.refresh(db_llm_info)
+    if refresh:
+        db.refresh(db_llm_info)
     return db_llm_info
 
 def get_llm_info(db: Session, restaurant_id: int) -> Optional[models.RestaurantLLMInfo]:
@@ -78,14 +137,16 @@ def get_llm_info(db: Session, restaurant_id: int) -> Optional[models.RestaurantL
 def update_llm_info(
     db: Session, 
     restaurant_id: int, 
-    llm_info_data: Dict[str, Any]
+    llm_info_data: Dict[str, Any],
+    refresh: bool = False
 ) -> Optional[models.RestaurantLLMInfo]:
     db_llm_info = get_llm_info(db, restaurant_id)
     if db_llm_info:
         for key, value in llm_info_data.items():
             setattr(db_llm_info, key, value)
         db.commit()
-        db.refresh(db_llm_info)
+        if refresh:
+            db.refresh(db_llm_info)
     return db_llm_info
 
 def delete_llm_info(db: Session, restaurant_id: int) -> bool:
@@ -102,7 +163,9 @@ def get_restaurant_with_llm_info(
     restaurant_id: int
 ) -> Optional[models.Restaurant]:
     """Get a restaurant with its LLM info in a single query."""
-    return db.query(models.Restaurant).filter(
+    return db.query(models.Restaurant).options(
+        joinedload(models.Restaurant.llm_info)
+    ).filter(
         models.Restaurant.id == restaurant_id
     ).first()
 
@@ -112,4 +175,6 @@ def get_all_restaurants_with_llm_info(
     limit: int = 100
 ) -> List[models.Restaurant]:
     """Get all restaurants with their LLM info in a single query."""
-    return db.query(models.Restaurant).offset(skip).limit(limit).all() 
\ No newline at end of file
+    return db.query(models.Restaurant).options(
+        joinedload(models.Restaurant.llm_info)
+    ).offset(skip).limit(limit).all() 
\ No newline at end of file
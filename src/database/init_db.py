@@ -1,8 +1,12 @@
-from .database import engine
+from .database import get_engine
 from . import models
 
 def init_db():
+    engine = get_engine()
     models.Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, so add any indexes missing from older databases
+    for index in models.Restaurant.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
 
 if __name__ == "__main__":
     print("Creating database tables...")
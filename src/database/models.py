@@ -5,11 +5,13 @@ from .database import Base
 
 class Restaurant(Base):
     __tablename__ = "Restaurant"  # Note: SQLite is case-sensitive for table names
+    # Fetch server-generated timestamps with RETURNING as part of each INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(Text, nullable=False)
+    name = Column(Text, nullable=False, index=True)
     description = Column(Text)
-    address = Column(Text, nullable=False)
+    address = Column(Text, nullable=False, unique=True, index=True)
     source = Column(Text)
     source_url = Column(Text)
     created_at = Column(DateTime, server_default=func.current_timestamp())
@@ -20,6 +22,7 @@ class Restaurant(Base):
 
 class RestaurantLLMInfo(Base):
     __tablename__ = "RestaurantLLMInfo"
+    __mapper_args__ = {"eager_defaults": True}
     
     restaurant_id = Column(Integer, ForeignKey("Restaurant.id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
     cuisine = Column(Text)
@@ -1,12 +1,26 @@
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+from sqlalchemy.exc import IntegrityError
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement, soupparser
+from lxml.cssselect import CSSSelector
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+import asyncio
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import dataclasses
+import hashlib
+import multiprocessing
 import logging
-import json
+import os
+import orjson
+import re
 import tldextract
-import concurrent.futures
-import time
+from collections import OrderedDict
+from collections.abc import Iterator
 
 from src.database.database import get_db
 from src.database import crud
@@ -16,183 +30,503 @@ from src.database import crud
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def parse_json_ld(soup: BeautifulSoup) -> dict | None:
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Throttled and server-error responses worth another attempt
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Shared so repeated scrapes reuse keep-alive connections instead of a new TCP+TLS handshake each time;
+# the adapter also retries connection errors and _RETRY_STATUSES responses with backoff
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=_RETRY_STATUSES),
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# Parses pages on other cores while the event loop keeps fetching; created on first use by _get_parse_pool
+_PARSE_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+
+# url -> (ETag, Last-Modified, body digest, restaurants) from the last successful scrape of that page,
+# least recently used first; capped at _PAGE_CACHE_MAXSIZE pages
+_PAGE_CACHE: OrderedDict[str, tuple[str | None, str | None, bytes, list['ScrapedRestaurant']]] = OrderedDict()
+_PAGE_CACHE_MAXSIZE = 512
+
+_JSON_LD_PATTERN = re.compile(rb'<script[^>]+application/ld\+json[^>]*>\s*(.*?)\s*</script>', re.DOTALL)
+
+# Compiled once so every page and map card reuses the same selectors
+_MAP_CARD_SELECTOR = CSSSelector('div.duet--article--map-card[data-slug]')
+_ADDRESS_SELECTOR = CSSSelector('span.hkfm3hg')
+_DESCRIPTION_SELECTOR = CSSSelector('p.duet--article--dangerously-set-cms-markup')
+
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class ScrapedRestaurant:
+    """A restaurant scraped from a blog post, in the shape stored in the database."""
+    # Field order is the TSV column order
+    name: str | None
+    description: str | None
+    source: str
+    source_url: str
+    address: str
+
+    def to_dict(self) -> dict:
+        # Flat copy; dataclasses.asdict deep-copies every value, which is several times slower
+        return {field: getattr(self, field) for field in self.__slots__}
+
+def parse_html(html_bytes: bytes) -> HtmlElement:
     """
-    Parse the JSON-LD script tag from the BeautifulSoup object.
+    Parse HTML into an lxml tree, falling back to BeautifulSoup's html.parser if lxml rejects it.
     Args:
-        soup (BeautifulSoup): Parsed HTML soup.
+        html_bytes (bytes): UTF-8 encoded HTML content.
     Returns:
-        dict | None: Parsed JSON-LD data or None if not found/invalid.
+        HtmlElement: Root element of the parsed page.
     """
-    script_tag = soup.find('script', type='application/ld+json')
-    if not script_tag:
-        logger.error("No JSON-LD data found in the page")
+    try:
+        return lxml_html.fromstring(html_bytes, parser=_HTML_PARSER)
+    except etree.ParserError as e:
+        logger.warning(f"lxml rejected the page, falling back to html.parser: {e}")
+        return soupparser.fromstring(html_bytes, features='html.parser')
+
+
+def find_json_ld_streaming(html_bytes: bytes) -> str | None:
+    """
+    Incrementally parse the page and stop at the first JSON-LD script tag.
+    Only used when the regex can't find the tag; the rest of the document is never parsed.
+    Args:
+        html_bytes (bytes): UTF-8 encoded HTML content.
+    Returns:
+        str | None: Contents of the JSON-LD script tag, or None if the page has none.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='script', encoding='utf-8')
+    for start in range(0, len(html_bytes), _STREAM_CHUNK_SIZE):
+        parser.feed(html_bytes[start:start + _STREAM_CHUNK_SIZE])
+        for _, script_tag in parser.read_events():
+            if script_tag.get('type') == 'application/ld+json':
+                return script_tag.text or ''
+    try:
+        parser.close()
+    except etree.LxmlError:
         return None
-    json_text = script_tag.get_text(strip=True)
+    for _, script_tag in parser.read_events():
+        if script_tag.get('type') == 'application/ld+json':
+            return script_tag.text or ''
+    return None
+
+
+def parse_json_ld(html: str | bytes) -> dict | None:
+    """
+    Parse the JSON-LD script tag from the page without building a DOM.
+    Args:
+        html (str | bytes): Raw page HTML.
+    Returns:
+        dict | None: Parsed JSON-LD data or None if not found/invalid.
+    """
+    html_bytes = html.encode('utf-8') if isinstance(html, str) else html
+    match = _JSON_LD_PATTERN.search(html_bytes)
+    if match:
+        # orjson reads the memoryview in place, so the JSON-LD payload is never copied out of the page
+        json_text = memoryview(html_bytes)[match.start(1):match.end(1)]
+    else:
+        json_text = find_json_ld_streaming(html_bytes)
+        if json_text is None:
+            logger.error("No JSON-LD data found in the page")
+            return None
+        json_text = json_text.strip()
     if not json_text:
         logger.error("JSON-LD script tag is empty")
         return None
     try:
-        return json.loads(json_text)
-    except json.JSONDecodeError as e:
+        return orjson.loads(json_text)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Error parsing JSON-LD data: {e}")
         return None
 
 
-def get_restaurant_items(json_data: dict) -> list[dict]:
+def get_restaurant_items(json_data: dict) -> Iterator[dict]:
     """
-    Extract restaurant items from JSON-LD data.
+    Lazily yield restaurant items from JSON-LD data.
     Args:
         json_data (dict): Parsed JSON-LD data.
     Returns:
-        list[dict]: List of restaurant item dicts.
+        Iterator[dict]: Restaurant item dicts, in page order.
     """
-    items = []
-    if not json_data or 'itemListElement' not in json_data:
-        return items
-    for item in json_data['itemListElement']:
-        if 'item' in item and item['item'].get('@type') == 'Restaurant':
-            items.append(item['item'])
-    return items
+    if not json_data:
+        return
+    for element in json_data.get('itemListElement', ()):
+        item = element.get('item')
+        if item and item.get('@type') == 'Restaurant':
+            yield item
 
 
-def extract_map_card_info(soup: BeautifulSoup, restaurant: dict) -> tuple[str | None, str | None]:
+def read_map_card(map_card: HtmlElement) -> tuple[str | None, str | None]:
     """
-    Extract address and description from the map card for a restaurant.
+    Read the address and description out of a single map card.
     Args:
-        soup (BeautifulSoup): Parsed HTML soup.
-        restaurant (dict): Restaurant item dict.
+        map_card (HtmlElement): Map card div.
     Returns:
         tuple[str | None, str | None]: (address, description)
     """
     address = None
     description = None
-    map_card = soup.find('div', {'class': 'duet--article--map-card', 'data-slug': restaurant.get('url', '').split('#')[-1]})
-    if isinstance(map_card, Tag):
-        address_span = map_card.find('span', class_='hkfm3hg')
-        if address_span:
-            address = address_span.text.strip()
-        description_paragraphs = map_card.find_all('p', class_='duet--article--dangerously-set-cms-markup')
-        if description_paragraphs:
-            description = ' '.join([p.text.strip() for p in description_paragraphs])
+    address_spans = _ADDRESS_SELECTOR(map_card)
+    if address_spans:
+        address = address_spans[0].text_content().strip()
+    description_paragraphs = _DESCRIPTION_SELECTOR(map_card)
+    if description_paragraphs:
+        description = ' '.join([p.text_content().strip() for p in description_paragraphs])
     return address, description
 
 
-def build_restaurant_dict(restaurant: dict, address: str, description: str | None) -> dict:
+def index_map_cards(tree: HtmlElement) -> dict[str, tuple[str | None, str | None]]:
+    """
+    Read every map card on the page in a single pass, keyed by its data-slug.
+    Args:
+        tree (HtmlElement): Parsed page from parse_html.
+    Returns:
+        dict[str, tuple[str | None, str | None]]: (address, description) keyed by slug.
+    """
+    return {card.get('data-slug'): read_map_card(card) for card in _MAP_CARD_SELECTOR(tree)}
+
+
+def extract_map_card_info(
+    map_cards: dict[str, tuple[str | None, str | None]], restaurant: dict
+) -> tuple[str | None, str | None]:
+    """
+    Look up the address and description from the map card for a restaurant.
+    Args:
+        map_cards (dict[str, tuple[str | None, str | None]]): Card info keyed by slug, from index_map_cards.
+        restaurant (dict): Restaurant item dict.
+    Returns:
+        tuple[str | None, str | None]: (address, description)
+    """
+    _, sep, slug = restaurant.get('url', '').rpartition('#')
+    # A URL without a fragment has an empty slug, not the whole URL
+    return map_cards.get(slug if sep else '', (None, None))
+
+
+def build_restaurant_dict(restaurant: dict, address: str, description: str | None, source: str | None = None) -> ScrapedRestaurant:
     """
-    Build a dictionary representing a restaurant.
+    Build the ScrapedRestaurant record for a restaurant item.
     Args:
         restaurant (dict): Restaurant item dict.
         address (str): Restaurant address.
         description (str | None): Restaurant description.
+        source (str | None): Source domain; derived from the restaurant URL if not given.
     Returns:
-        dict: Restaurant dictionary for output/storage.
+        ScrapedRestaurant: Restaurant record for output/storage.
     """
-    return {
-        'name': restaurant.get('name'),
-        'description': description,
-        'source': tldextract.extract(restaurant.get('url', '')).domain,
-        'source_url': restaurant.get('url', ''),
-        'address': address,
-    }
+    if source is None:
+        source = tldextract.extract(restaurant.get('url', '')).domain
+    return ScrapedRestaurant(
+        name=restaurant.get('name'),
+        address=address,
+        description=description,
+        source=source,
+        source_url=restaurant.get('url', ''),
+    )
 
 
-def extract_restaurant_data(html_content: str, url: str) -> list[dict]:
+def extract_restaurant_data(html_content: str | bytes, url: str) -> list[ScrapedRestaurant]:
     """
     Extract restaurant data from Eater blog HTML content using JSON-LD data.
     Args:
-        html_content (str): HTML content of the Eater blog post.
+        html_content (str | bytes): HTML content of the Eater blog post.
         url (str): URL of the Eater blog post.
     Returns:
-        list[dict]: List of dictionaries containing restaurant data.
+        list[ScrapedRestaurant]: Restaurants found in the post.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    html_bytes = html_content.encode('utf-8') if isinstance(html_content, str) else html_content
     restaurants = []
-    json_data = parse_json_ld(soup)
+    json_data = parse_json_ld(html_bytes)
     if not json_data:
         return restaurants
     logger.info(f"Successfully parsed JSON-LD data with {len(json_data.get('itemListElement', []))} items")
+    # Only pages that actually list restaurants pay for building the DOM
+    map_cards = index_map_cards(parse_html(html_bytes))
+    source = tldextract.extract(url).domain
     for restaurant in get_restaurant_items(json_data):
         logger.info(f"Processing restaurant: {restaurant.get('name')}")
-        address, description = extract_map_card_info(soup, restaurant)
+        address, description = extract_map_card_info(map_cards, restaurant)
         if not address:
             logger.warning(f"Skipping restaurant {restaurant.get('name')} - no address found")
             continue
-        restaurant_dict = build_restaurant_dict(restaurant, address, description)
-        restaurants.append(restaurant_dict)
+        restaurants.append(build_restaurant_dict(restaurant, address, description, source))
         logger.info(f"Successfully added restaurant: {restaurant.get('name')}")
     logger.info(f"Successfully extracted {len(restaurants)} restaurants from JSON-LD data")
     return restaurants
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    reraise=True
-)
-def scrape_eater_blog(url: str) -> list[dict]:
+def _page_html(response: requests.Response | httpx.Response, encoding: str | None) -> str | bytes:
+    """
+    Pick what to hand extract_restaurant_data for a response.
+    Args:
+        response (requests.Response | httpx.Response): Fetched page.
+        encoding (str | None): Charset the server declared for the body.
+    Returns:
+        str | bytes: The raw body when it is declared UTF-8, so the parser can skip a decode; the decoded text otherwise.
+    """
+    if encoding and encoding.lower().replace('_', '-') in ('utf-8', 'utf8'):
+        return response.content
+    return response.text
+
+
+def save_debug_html(content: bytes) -> None:
+    """
+    Write the raw page to debug_response.html when the EATER_DEBUG_HTML env var is set.
+    Args:
+        content (bytes): Raw HTML response body.
+    """
+    if not os.environ.get('EATER_DEBUG_HTML'):
+        return
+    with open('debug_response.html', 'wb') as f:
+        f.write(content)
+    logger.info("Saved HTML response to debug_response.html")
+
+
+def save_restaurants(restaurants: list[ScrapedRestaurant]) -> None:
+    """
+    Insert or update scraped restaurants in the database in a single transaction.
+    Args:
+        restaurants (list[ScrapedRestaurant]): Restaurants from extract_restaurant_data.
+    """
+    rows = [restaurant.to_dict() for restaurant in restaurants]
+    with get_db() as db:
+        existing_ids = crud.get_restaurant_ids_by_addresses(db, [r.address for r in restaurants])
+        for restaurant in restaurants:
+            if restaurant.address in existing_ids:
+                logger.info(f"Updating existing restaurant at address {restaurant.address}: {restaurant.name}")
+            else:
+                logger.info(f"Creating new restaurant: {restaurant.name} at {restaurant.address}")
+        if existing_ids:
+            crud.bulk_upsert_restaurants(db, rows)
+            return
+        try:
+            crud.bulk_create_restaurants(db, rows)
+        except IntegrityError:
+            # Another page saved one of these addresses since the prefetch, or the page lists it twice
+            db.rollback()
+            crud.bulk_upsert_restaurants(db, rows)
+
+
+def _request_headers(url: str) -> dict[str, str]:
+    """
+    Build request headers, adding validators from the last scrape so an unchanged page can come back as a 304.
+    Args:
+        url (str): URL about to be fetched.
+    Returns:
+        dict[str, str]: Headers for the request.
+    """
+    cached = _cached_page(url)
+    if not cached:
+        return HEADERS
+    etag, last_modified, _, _ = cached
+    headers = dict(HEADERS)
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _cached_page(url: str) -> tuple[str | None, str | None, bytes, list[ScrapedRestaurant]] | None:
+    cached = _PAGE_CACHE.get(url)
+    if cached is not None:
+        _PAGE_CACHE.move_to_end(url)
+    return cached
+
+
+def _body_digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def get_cached_restaurants(url: str, status_code: int, content: bytes) -> list[ScrapedRestaurant] | None:
+    """
+    Return the restaurants from the last scrape of url if the page hasn't changed since.
+    Args:
+        url (str): URL of the Eater blog post.
+        status_code (int): HTTP status of the new response.
+        content (bytes): Body of the new response.
+    Returns:
+        list[ScrapedRestaurant] | None: Cached restaurants, or None if the page must be parsed again.
+    """
+    cached = _cached_page(url)
+    if not cached:
+        return None
+    if status_code == 304 or cached[2] == _body_digest(content):
+        logger.info(f"Page unchanged since last scrape, reusing {len(cached[3])} restaurants: {url}")
+        return list(cached[3])
+    return None
+
+
+def cache_restaurants(url: str, response_headers, content: bytes, restaurants: list[ScrapedRestaurant]) -> None:
+    """
+    Remember a page's validators, body digest and parsed restaurants for later scrapes of the same URL.
+    Args:
+        url (str): URL of the Eater blog post.
+        response_headers: Response headers (case-insensitive mapping).
+        content (bytes): Body of the response.
+        restaurants (list[ScrapedRestaurant]): Restaurants extracted from the page.
+    """
+    _PAGE_CACHE[url] = (
+        response_headers.get('ETag'),
+        response_headers.get('Last-Modified'),
+        _body_digest(content),
+        list(restaurants),
+    )
+    _PAGE_CACHE.move_to_end(url)
+    while len(_PAGE_CACHE) > _PAGE_CACHE_MAXSIZE:
+        _PAGE_CACHE.popitem(last=False)
+
+
+def scrape_eater_blog(url: str) -> list[ScrapedRestaurant]:
     """
     Scrape restaurant data from an Eater blog post.
     Args:
         url (str): URL of the Eater blog post.
     Returns:
-        list[dict]: List of dictionaries containing restaurant data.
+        list[ScrapedRestaurant]: Restaurants found in the post.
     """
     try:
         logger.info(f"Starting to scrape: {url}")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=_request_headers(url), timeout=15)
         response.raise_for_status()
         logger.info(f"Response status: {response.status_code}")
         logger.info(f"Response headers: {dict(response.headers)}")
-        logger.debug(f"Response text (first 500 chars): {response.text[:500]}")
-        logger.info("Saved HTML response to debug_response.html")
-        restaurants = extract_restaurant_data(response.text, url)
-        logger.info(f"Found {len(restaurants)} restaurants")
-        with get_db() as db:
-            for restaurant in restaurants:
-                existing = crud.get_restaurant_by_address(db, restaurant['address'])
-                if existing:
-                    logger.info(f"Updating existing restaurant at address {restaurant['address']}: {restaurant['name']}")
-                    crud.update_restaurant(db, existing.id, restaurant) # type: ignore
-                else:
-                    logger.info(f"Creating new restaurant: {restaurant['name']} at {restaurant['address']}")
-                    crud.create_restaurant(db, restaurant)
+        restaurants = get_cached_restaurants(url, response.status_code, response.content)
+        if restaurants is None:
+            logger.debug(f"Response body (first 500 bytes): {response.content[:500]!r}")
+            save_debug_html(response.content)
+            restaurants = extract_restaurant_data(_page_html(response, response.encoding), url)
+            logger.info(f"Found {len(restaurants)} restaurants")
+            cache_restaurants(url, response.headers, response.content, restaurants)
+        # Saved even when the page is unchanged, so rows edited or deleted since the last scrape are restored
+        save_restaurants(restaurants)
         return restaurants
     except requests.RequestException as e:
         logger.error(f"Error scraping {url}: {e}")
-        raise  # Re-raise the exception to trigger retry
+        raise  # Transient failures were already retried by the session's adapter
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise
 
-def scrape_eater_blogs_concurrently(urls: list[str], max_workers: int = 5):
+def _get_parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # spawn rather than fork: executor threads are already running by the time the pool starts
+        _PARSE_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _PARSE_POOL
+
+
+def _shutdown_parse_pool() -> None:
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown()
+        _PARSE_POOL = None
+
+
+async def _parse_in_pool(content: str | bytes, url: str) -> list[ScrapedRestaurant]:
     """
-    Scrape multiple Eater blog posts concurrently.
+    Run extract_restaurant_data in the parse pool, replacing the pool once if a worker died and broke it.
+    Args:
+        content (str | bytes): Page to parse, from _page_html.
+        url (str): URL of the Eater blog post.
+    Returns:
+        list[ScrapedRestaurant]: Restaurants found in the post.
+    """
+    global _PARSE_POOL
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+    try:
+        return await loop.run_in_executor(pool, extract_restaurant_data, content, url)
+    except BrokenProcessPool:
+        logger.warning(f"Parse pool broke while parsing {url}, starting a new one")
+        # Other scrapes may have hit the same broken pool and already replaced it
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+            pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(_get_parse_pool(), extract_restaurant_data, content, url)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed async scrape is worth retrying: connection problems and throttled/5xx responses only."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+@retry(
+    retry=retry_if_exception(_is_transient),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    reraise=True
+)
+async def _scrape_one(client: httpx.AsyncClient, url: str) -> list[ScrapedRestaurant]:
+    """
+    Scrape restaurant data from an Eater blog post using a shared async HTTP client.
+    Parsing runs in a process pool and database writes in the default executor so neither blocks the event loop.
+    Args:
+        client (httpx.AsyncClient): Client shared across all URLs in a run.
+        url (str): URL of the Eater blog post.
+    Returns:
+        list[ScrapedRestaurant]: Restaurants found in the post.
+    """
+    logger.info(f"Starting to scrape: {url}")
+    response = await client.get(url, headers=_request_headers(url))
+    logger.info(f"Response status for {url}: {response.status_code} ({response.http_version})")
+    # httpx treats every non-2xx as an error, so check for 304 Not Modified first
+    restaurants = get_cached_restaurants(url, response.status_code, response.content)
+    loop = asyncio.get_running_loop()
+    if restaurants is None:
+        response.raise_for_status()
+        save_debug_html(response.content)
+        restaurants = await _parse_in_pool(_page_html(response, response.charset_encoding), url)
+        logger.info(f"Found {len(restaurants)} restaurants")
+        cache_restaurants(url, response.headers, response.content, restaurants)
+    # Saved even when the page is unchanged, so rows edited or deleted since the last scrape are restored
+    await loop.run_in_executor(None, save_restaurants, restaurants)
+    return restaurants
+
+async def _scrape_all(urls: list[str], max_workers: int) -> None:
+    # Bounds whole scrapes (fetch, parse and save), not just open connections
+    semaphore = asyncio.Semaphore(max_workers)
+    # Keep every connection alive between requests so HTTP/2 streams reuse them
+    limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+    async with httpx.AsyncClient(http2=True, timeout=30, limits=limits, follow_redirects=True) as client:
+        async def scrape_bounded(url: str) -> list[ScrapedRestaurant]:
+            async with semaphore:
+                return await _scrape_one(client, url)
+        results = await asyncio.gather(*(scrape_bounded(url) for url in urls), return_exceptions=True)
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            logger.error(f'{url} generated an exception: {result}')
+        else:
+            logger.info(f"Successfully processed {len(result)} restaurants from {url}")
+
+def scrape_eater_blogs_concurrently(urls: list[str], max_workers: int = 20):
+    """
+    Scrape multiple Eater blog posts concurrently on an asyncio event loop.
     Args:
         urls (list[str]): A list of Eater blog post URLs to scrape.
-        max_workers (int): The maximum number of threads to use.
-    """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {executor.submit(scrape_eater_blog, url): url for url in urls}
-        for future in concurrent.futures.as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                restaurants = future.result()
-                logger.info(f"Successfully processed {len(restaurants)} restaurants from {url}")
-            except Exception as exc:
-                logger.error(f'{url} generated an exception: {exc}')
-        
-        # Explicitly shutdown the executor and wait for threads to finish
-        executor.shutdown(wait=True)
-    
-    # Give threads a moment to fully clean up before interpreter shutdown
-    time.sleep(0.1)
-    logger.info("All threads completed and cleaned up successfully")
+        max_workers (int): The maximum number of blog posts scraped at once.
+    """
+    try:
+        asyncio.run(_scrape_all(urls, max_workers))
+    finally:
+        _shutdown_parse_pool()
+    logger.info(f"Finished scraping {len(urls)} URLs")
 
 if __name__ == "__main__":
     urls_to_scrape = [
@@ -1,4 +1,4 @@
-import pandas as pd
+import csv
 from pathlib import Path
 
 def save_to_tsv(restaurants, output_file: str):
@@ -6,7 +6,7 @@ def save_to_tsv(restaurants, output_file: str):
     Save restaurant data to a TSV file.
     
     Args:
-        restaurants (list): List of dictionaries containing restaurant data
+        restaurants (list): ScrapedRestaurant records from the scraper
         output_file (str): Path to output TSV file
     """
     # Get the project root directory (assuming this file is in src/scrape)
@@ -19,6 +19,11 @@ def save_to_tsv(restaurants, output_file: str):
     # Construct the full output path
     output_path = output_dir / output_file
     
-    df = pd.DataFrame(restaurants)
-    df.to_csv(output_path, index=False, sep='\t')
+    # Same layout pandas' to_csv produced: header row, fields quoted only when they need it, None as empty
+    rows = [restaurant.to_dict() for restaurant in restaurants]
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter='\t', lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
     print(f"Saved {len(restaurants)} restaurants to {output_path}")
\ No newline at end of file
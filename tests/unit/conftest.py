@@ -1,9 +1,51 @@
+import copy
+import json
 import os
 import pytest
 from unittest import mock
 import requests
+from sqlalchemy import event
+from sqlalchemy.orm import Session, raiseload
 
 
+@pytest.fixture(autouse=True)
+def clear_engine_cache():
+    """Drop the cached engine so each test sees its own environment."""
+    from src.database import database
+    database.get_engine.cache_clear()
+    yield
+    database.get_engine.cache_clear()
+
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    """Start every test without pages cached by earlier scrapes."""
+    from src.scrape import eater_blog
+    eater_blog._PAGE_CACHE.clear()
+    yield
+    eater_blog._PAGE_CACHE.clear()
+
+@pytest.fixture(autouse=True)
+def shutdown_parse_pool():
+    """Shut down the parse process pool if a test started it."""
+    yield
+    from src.scrape import eater_blog
+    eater_blog._shutdown_parse_pool()
+
+@pytest.fixture(autouse=True)
+def raise_on_lazy_load():
+    """Fail any test that lazy-loads a relationship instead of eager-loading it (N+1 guard)."""
+    def add_raiseload(orm_execute_state):
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+    event.listen(Session, "do_orm_execute", add_raiseload)
+    yield
+    event.remove(Session, "do_orm_execute", add_raiseload)
+
 @pytest.fixture
 def mock_sqlite_env(tmp_path):
     """Mock the SQLITE_DATABASE_PATH environment variable to point to a temp file."""
@@ -17,27 +59,34 @@ def mock_sessionlocal():
     with mock.patch("src.database.database.get_sessionlocal") as mock_session:
         yield mock_session
 
+SAMPLE_JSON_LD = {
+    "@type": "ItemList",
+    "itemListElement": [
+        {
+            "item": {
+                "@type": "Restaurant",
+                "name": "Test Restaurant",
+                "url": "https://eater.com/test-restaurant#test-slug"
+            }
+        },
+        {
+            "item": {
+                "@type": "NotARestaurant",
+                "name": "Should Be Ignored"
+            }
+        }
+    ]
+}
+
 @pytest.fixture
 def sample_json_ld():
     """Provide sample JSON-LD data for testing restaurant parsing."""
-    return {
-        "@type": "ItemList",
-        "itemListElement": [
-            {
-                "item": {
-                    "@type": "Restaurant",
-                    "name": "Test Restaurant",
-                    "url": "https://eater.com/test-restaurant#test-slug"
-                }
-            },
-            {
-                "item": {
-                    "@type": "NotARestaurant",
-                    "name": "Should Be Ignored"
-                }
-            }
-        ]
-    }
+    return copy.deepcopy(SAMPLE_JSON_LD)
+
+@pytest.fixture(scope="session")
+def sample_json_ld_str():
+    """Provide the sample JSON-LD serialized once per test session for embedding in HTML."""
+    return json.dumps(SAMPLE_JSON_LD)
 
 @pytest.fixture
 def sample_html():
@@ -70,6 +119,8 @@ def mock_response(sample_html):
     """Provide a mock HTTP response for testing web requests."""
     mock_resp = mock.Mock(spec=requests.Response)
     mock_resp.text = sample_html
+    mock_resp.content = sample_html.encode()
     mock_resp.status_code = 200
+    mock_resp.encoding = "utf-8"
     mock_resp.headers = {"content-type": "text/html"}
     return mock_resp 
\ No newline at end of file
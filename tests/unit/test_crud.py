@@ -0,0 +1,116 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+
+@pytest.fixture
+def db(mock_sqlite_env):
+    """Provide a session on a fresh SQLite database with one restaurant and its LLM info."""
+    from src.database.database import Base, get_engine, get_db
+    from src.database import crud
+    Base.metadata.create_all(get_engine())
+    with get_db() as session:
+        restaurant = crud.create_restaurant(session, {"name": "Test Restaurant", "address": "123 Test St"})
+        crud.create_llm_info(session, restaurant.id, {"cuisine": "Thai"})
+        yield session
+
+def test_get_all_restaurants_with_llm_info_eager_loads(db):
+    """Test that LLM info is loaded with the restaurants rather than lazily per row."""
+    from src.database import crud
+    restaurants = crud.get_all_restaurants_with_llm_info(db)
+    assert [r.llm_info.cuisine for r in restaurants] == ["Thai"]
+
+def test_get_restaurant_with_llm_info_eager_loads(db):
+    """Test that a single restaurant comes back with its LLM info already loaded."""
+    from src.database import crud
+    restaurant = crud.get_restaurant_with_llm_info(db, 1)
+    assert restaurant.llm_info.cuisine == "Thai"
+
+def test_lazy_llm_info_access_is_caught(db):
+    """Test that the N+1 guard flags relationship access without an eager load."""
+    from src.database import crud
+    restaurant = crud.get_restaurants(db)[0]
+    with pytest.raises(InvalidRequestError):
+        restaurant.llm_info
+
+@pytest.fixture
+def statements(db):
+    """Record the SQL statements the test session's engine executes."""
+    from sqlalchemy import event
+    executed = []
+    def record(conn, cursor, statement, *args):
+        executed.append(statement)
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+def test_create_restaurant_without_refresh_returns_loaded_object(mock_sqlite_env, db, statements):
+    """Test that a created restaurant comes back fully loaded from the INSERT alone and survives the session."""
+    from src.database.database import get_db
+    from src.database import crud
+    with get_db() as session:
+        restaurant = crud.create_restaurant(session, {"name": "New Restaurant", "address": "456 New St"})
+    assert not any(s.startswith("SELECT") for s in statements)
+    assert restaurant.id == 2
+    assert restaurant.name == "New Restaurant"
+    assert restaurant.created_at is not None
+
+def test_create_restaurant_with_refresh_reloads_row(db, statements):
+    """Test that refresh=True reloads the row from the database after the commit."""
+    from src.database import crud
+    restaurant = crud.create_restaurant(db, {"name": "New Restaurant", "address": "456 New St"}, refresh=True)
+    assert any(s.startswith("SELECT") for s in statements)
+    assert restaurant.created_at is not None
+
+def test_update_restaurant_without_refresh_returns_loaded_object(mock_sqlite_env, db):
+    """Test that an updated restaurant carries its new values and updated_at after the session closes."""
+    from src.database.database import get_db
+    from src.database import crud
+    with get_db() as session:
+        restaurant = crud.update_restaurant(session, 1, {"name": "Renamed"})
+    assert restaurant.name == "Renamed"
+    assert restaurant.updated_at is not None
+
+def test_update_llm_info_with_refresh_reloads_row(db, statements):
+    """Test that refresh=True on an LLM info update reloads the row."""
+    from src.database import crud
+    llm_info = crud.update_llm_info(db, 1, {"vibe": "Cozy"}, refresh=True)
+    assert any(s.startswith("SELECT") for s in statements)
+    assert (llm_info.cuisine, llm_info.vibe) == ("Thai", "Cozy")
+
+def test_batched_writes_are_visible_before_commit(db):
+    """Test that autocommit=False writes are flushed for later queries and only persist on commit."""
+    from src.database import crud
+    created = crud.create_restaurant(db, {"name": "New Restaurant", "address": "456 New St"}, autocommit=False)
+    crud.update_restaurant(db, 1, {"name": "Renamed"}, autocommit=False)
+    assert created.id is not None
+    assert crud.get_restaurant_by_address(db, "456 New St") is created
+    assert crud.get_restaurant_by_name(db, "Renamed").id == 1
+
+    db.rollback()
+    assert crud.get_restaurant_by_address(db, "456 New St") is None
+    assert crud.get_restaurant_by_name(db, "Test Restaurant").id == 1
+
+def test_batched_writes_persist_on_commit(mock_sqlite_env, db):
+    """Test that autocommit=False writes are saved once the caller commits."""
+    from src.database.database import get_db
+    from src.database import crud
+    crud.create_restaurant(db, {"name": "New Restaurant", "address": "456 New St"}, autocommit=False)
+    crud.update_restaurant(db, 1, {"name": "Renamed"}, autocommit=False)
+    db.commit()
+    db.close()
+    with get_db() as session:
+        assert sorted(r.name for r in crud.get_restaurants(session)) == ["New Restaurant", "Renamed"]
+
+def test_list_restaurants_fast_returns_row_mappings(db):
+    """Test that restaurants come back as plain mappings of the table's columns, honouring skip and limit."""
+    from src.database import crud
+    for i in range(2, 5):
+        crud.create_restaurant(db, {"name": f"Restaurant {i}", "address": f"{i} Test St"})
+    rows = crud.list_restaurants_fast(db, skip=1, limit=2)
+    assert [row["name"] for row in rows] == ["Restaurant 2", "Restaurant 3"]
+    assert set(rows[0].keys()) == {
+        "id", "name", "description", "address", "source", "source_url", "created_at", "updated_at"
+    }
+    assert rows[0]["address"] == "2 Test St"
+    assert len(crud.list_restaurants_fast(db)) == 4
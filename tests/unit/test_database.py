@@ -31,4 +31,16 @@ def test_get_db_db_connection_failure(monkeypatch):
     with mock.patch("src.database.database.create_engine", side_effect=Exception("DB fail")):
         from src.database import database
         with pytest.raises(Exception, match="DB fail"):
-            database.get_engine()
\ No newline at end of file
+            database.get_engine()
+
+# Session factory follows the cached engine
+def test_get_sessionlocal_follows_engine(mock_sqlite_env, tmp_path, monkeypatch):
+    from src.database import database
+    first = database.get_sessionlocal()
+    assert database.get_sessionlocal() is first
+    assert first().get_bind() is database.get_engine()
+    monkeypatch.setenv("SQLITE_DATABASE_PATH", str(tmp_path / "other.db"))
+    database.get_engine.cache_clear()
+    second = database.get_sessionlocal()
+    assert second is not first
+    assert second().get_bind() is database.get_engine()
@@ -1,46 +1,113 @@
+import dataclasses
 import pytest
-from unittest.mock import Mock, patch
-from bs4 import BeautifulSoup
+from unittest.mock import AsyncMock, Mock, patch
+from lxml import etree
 import requests
-import json
+import httpx
+import asyncio
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from tenacity import wait_none
 
+from src.scrape import eater_blog
 from src.scrape.eater_blog import (
     parse_json_ld,
     get_restaurant_items,
+    index_map_cards,
     extract_map_card_info,
+    ScrapedRestaurant,
     build_restaurant_dict,
     extract_restaurant_data,
+    save_debug_html,
+    save_restaurants,
+    parse_html,
+    find_json_ld_streaming,
     scrape_eater_blog,
+    _scrape_one,
+    _SESSION,
     scrape_eater_blogs_concurrently,
 )
 
 
 # Happy Path Tests
 
+def test_parse_html_falls_back_to_html_parser(sample_html):
+    """Test that markup rejected by lxml is re-parsed with html.parser."""
+    with patch("src.scrape.eater_blog.lxml_html.fromstring", side_effect=etree.ParserError("rejected")):
+        tree = parse_html(sample_html.encode())
+    assert list(index_map_cards(tree)) == ["test-slug"]
+
+def test_parse_html_empty_document():
+    """Test that an empty page still yields a tree instead of raising."""
+    tree = parse_html(b"")
+    assert index_map_cards(tree) == {}
+
 def test_parse_json_ld_success(sample_html):
     """Test successful parsing of JSON-LD data from HTML."""
-    soup = BeautifulSoup(sample_html, 'html.parser')
-    result = parse_json_ld(soup)
+    result = parse_json_ld(sample_html)
     assert result is not None
     assert result["@type"] == "ItemList"
     assert len(result["itemListElement"]) == 1
 
+def test_parse_json_ld_from_bytes(sample_html):
+    """Test that the regex fast path parses JSON-LD straight from raw bytes without building a tree."""
+    with patch("src.scrape.eater_blog.parse_html") as mock_parse_html:
+        result = parse_json_ld(sample_html.encode())
+    assert result is not None
+    assert result["itemListElement"][0]["item"]["name"] == "Test Restaurant"
+    mock_parse_html.assert_not_called()
+
+def test_parse_json_ld_streaming_fallback():
+    """Test that JSON-LD the regex can't match is still found by the streaming parser."""
+    html = '<script>var x;</script><script data-x="1" type=application/ld+json> {"@type": "ItemList"} </script>'
+    with patch("src.scrape.eater_blog._JSON_LD_PATTERN") as mock_pattern, \
+         patch("src.scrape.eater_blog.parse_html") as mock_parse_html:
+        mock_pattern.search.return_value = None
+        result = parse_json_ld(html)
+    assert result == {"@type": "ItemList"}
+    mock_parse_html.assert_not_called()
+
+def test_find_json_ld_streaming_no_script():
+    """Test that the streaming fallback returns None for pages without JSON-LD, including empty ones."""
+    assert find_json_ld_streaming(b"<html><body>No JSON-LD here</body></html>") is None
+    assert find_json_ld_streaming(b"") is None
+
+def test_extract_restaurant_data_skips_dom_without_json_ld():
+    """Test that pages without JSON-LD never get a full DOM built."""
+    with patch("src.scrape.eater_blog.parse_html") as mock_parse_html:
+        result = extract_restaurant_data("<html><body>No JSON-LD here</body></html>", "https://test.eater.com")
+    assert result == []
+    mock_parse_html.assert_not_called()
+
 def test_get_restaurant_items_success(sample_json_ld):
     """Test successful extraction of restaurant items from JSON-LD data."""
-    result = get_restaurant_items(sample_json_ld)
+    result = list(get_restaurant_items(sample_json_ld))
     assert len(result) == 1
     assert result[0]["name"] == "Test Restaurant"
 
 def test_extract_map_card_info_success(sample_html):
     """Test successful extraction of address and description from map card."""
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    tree = parse_html(sample_html.encode())
     restaurant = {"url": "https://eater.com/test-restaurant#test-slug"}
-    address, description = extract_map_card_info(soup, restaurant)
+    address, description = extract_map_card_info(index_map_cards(tree), restaurant)
     assert address == "123 Test St, Test City, TC 12345"
     assert description == "A fantastic test restaurant."
 
+def test_index_map_cards_by_slug(sample_html):
+    """Test that map cards are indexed by their data-slug."""
+    map_cards = index_map_cards(parse_html(sample_html.encode()))
+    assert map_cards == {"test-slug": ("123 Test St, Test City, TC 12345", "A fantastic test restaurant.")}
+
+def test_index_map_cards_skips_cards_without_slug():
+    """Test that map cards with no data-slug are left out of the index."""
+    html = b'''
+    <div class="duet--article--map-card"><span class="hkfm3hg">No slug</span></div>
+    <div class="duet--article--map-card" data-slug="has-slug"></div>
+    '''
+    assert list(index_map_cards(parse_html(html))) == ["has-slug"]
+
 def test_build_restaurant_dict():
-    """Test building restaurant dictionary with all fields."""
+    """Test building a restaurant record with all fields."""
     restaurant = {
         "name": "Test Restaurant",
         "url": "https://eater.com/test-restaurant"
@@ -48,11 +115,18 @@ def test_build_restaurant_dict():
     address = "123 Test St"
     description = "Test Description"
     result = build_restaurant_dict(restaurant, address, description)
-    assert result["name"] == "Test Restaurant"
-    assert result["address"] == "123 Test St"
-    assert result["description"] == "Test Description"
-    assert result["source"] == "eater"
-    assert result["source_url"] == "https://eater.com/test-restaurant"
+    assert result.name == "Test Restaurant"
+    assert result.address == "123 Test St"
+    assert result.description == "Test Description"
+    assert result.source == "eater"
+    assert result.source_url == "https://eater.com/test-restaurant"
+    assert result.to_dict() == {
+        "name": "Test Restaurant",
+        "address": "123 Test St",
+        "description": "Test Description",
+        "source": "eater",
+        "source_url": "https://eater.com/test-restaurant",
+    }
 
 def test_extract_restaurant_data_success(sample_html):
     """Test successful extraction of restaurant data from HTML content."""
@@ -62,14 +136,14 @@ def test_extract_restaurant_data_success(sample_html):
     
     assert len(result) == 1
     restaurant = result[0]
-    # Test all fields from the restaurant dictionary
-    assert restaurant["name"] == "Test Restaurant"
-    assert restaurant["address"] == "123 Test St, Test City, TC 12345"
-    assert restaurant["description"] == "A fantastic test restaurant."
+    # Test all fields from the restaurant record
+    assert restaurant.name == "Test Restaurant"
+    assert restaurant.address == "123 Test St, Test City, TC 12345"
+    assert restaurant.description == "A fantastic test restaurant."
     # The source should come from the input URL, not the restaurant URL
-    assert restaurant["source"] == "eater"
+    assert restaurant.source == "eater"
     # The source_url should come from the JSON-LD data
-    assert restaurant["source_url"] == "https://eater.com/test-restaurant#test-slug"
+    assert restaurant.source_url == "https://eater.com/test-restaurant#test-slug"
 
 def test_extract_restaurant_data_no_json_ld():
     """Test handling of HTML content with no JSON-LD data."""
@@ -77,12 +151,12 @@ def test_extract_restaurant_data_no_json_ld():
     result = extract_restaurant_data(html, "https://test.eater.com")
     assert len(result) == 0
 
-def test_extract_restaurant_data_mixed_items(sample_json_ld):
+def test_extract_restaurant_data_mixed_items(sample_json_ld_str):
     """Test handling of JSON-LD data with mixed restaurant and non-restaurant items."""
     html = f"""
     <html>
         <script type="application/ld+json">
-            {json.dumps(sample_json_ld)}
+            {sample_json_ld_str}
         </script>
         <div class="duet--article--map-card" data-slug="test-slug">
             <span class="hkfm3hg">123 Test St, Test City, TC 12345</span>
@@ -92,14 +166,14 @@ def test_extract_restaurant_data_mixed_items(sample_json_ld):
     """
     result = extract_restaurant_data(html, "https://test.eater.com")
     assert len(result) == 1  # Should only get the restaurant, not the NotARestaurant
-    assert result[0]["name"] == "Test Restaurant"
+    assert result[0].name == "Test Restaurant"
 
-def test_extract_restaurant_data_missing_address(sample_json_ld):
+def test_extract_restaurant_data_missing_address(sample_json_ld_str):
     """Test handling of restaurant with missing address."""
     html = f"""
     <html>
         <script type="application/ld+json">
-            {json.dumps(sample_json_ld)}
+            {sample_json_ld_str}
         </script>
         <div class="duet--article--map-card" data-slug="test-slug">
             <p class="duet--article--dangerously-set-cms-markup">Description without address.</p>
@@ -109,77 +183,303 @@ def test_extract_restaurant_data_missing_address(sample_json_ld):
     result = extract_restaurant_data(html, "https://test.eater.com")
     assert len(result) == 0
 
-@patch("requests.get")
+@patch("src.scrape.eater_blog._SESSION.get")
 def test_scrape_eater_blog_success(mock_get, mock_response, mock_sessionlocal):
     """Test successful scraping of Eater blog."""
     mock_get.return_value = mock_response
     mock_db = Mock()
     mock_sessionlocal.return_value = Mock()
     mock_sessionlocal.return_value.return_value = mock_db
-    mock_db.query.return_value.filter.return_value.first.return_value = None
+    mock_db.query.return_value.filter.return_value.all.return_value = []
 
     result = scrape_eater_blog("https://test.eater.com/test-article")
     assert len(result) == 1
-    assert result[0]["name"] == "Test Restaurant"
-    assert result[0]["address"] == "123 Test St, Test City, TC 12345"
+    assert result[0].name == "Test Restaurant"
+    assert result[0].address == "123 Test St, Test City, TC 12345"
+
+def test_scrape_one_success(sample_html):
+    """Test scraping a single URL through a shared async client, parsing in the process pool."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=sample_html.encode()))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await _scrape_one(client, "https://test.eater.com/test-article")
+
+    with patch("src.scrape.eater_blog.save_restaurants") as mock_save:
+        result = asyncio.run(run())
+    assert eater_blog._PARSE_POOL is not None
+    assert len(result) == 1
+    assert result[0].name == "Test Restaurant"
+    mock_save.assert_called_once_with(result)
+
+@patch("src.scrape.eater_blog.save_restaurants")
+@patch("src.scrape.eater_blog._SESSION.get")
+def test_scrape_eater_blog_decodes_declared_charset(mock_get, mock_save, mock_response, sample_html):
+    """Test that a page served as latin-1 is decoded with that charset rather than as UTF-8."""
+    html = sample_html.replace("123 Test St", "123 Café St")
+    mock_response.content = html.encode("latin-1")
+    mock_response.text = html
+    mock_response.encoding = "ISO-8859-1"
+    mock_get.return_value = mock_response
+    result = scrape_eater_blog("https://test.eater.com/test-article")
+    assert result[0].address == "123 Café St, Test City, TC 12345"
+
+def test_scrape_one_decodes_declared_charset(sample_html):
+    """Test that the async scrape decodes a latin-1 page with the charset from its Content-Type."""
+    html = sample_html.replace("123 Test St", "123 Café St")
+    transport = httpx.MockTransport(lambda request: httpx.Response(
+        200, content=html.encode("latin-1"), headers={"Content-Type": "text/html; charset=iso-8859-1"}
+    ))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await _scrape_one(client, "https://test.eater.com/test-article")
+
+    with patch("src.scrape.eater_blog.save_restaurants"), \
+         patch("src.scrape.eater_blog._get_parse_pool", return_value=None):
+        result = asyncio.run(run())
+    assert result[0].address == "123 Café St, Test City, TC 12345"
+
+@patch("src.scrape.eater_blog.save_restaurants")
+@patch("src.scrape.eater_blog._SESSION.get")
+def test_scrape_eater_blog_unchanged_page_uses_cache(mock_get, mock_save, mock_response):
+    """Test that rescraping an unchanged page reuses the cached result without parsing, but still saves it."""
+    mock_response.headers = {"ETag": '"abc"'}
+    mock_get.return_value = mock_response
+    first = scrape_eater_blog("https://test.eater.com/test-article")
+
+    with patch("src.scrape.eater_blog.extract_restaurant_data") as mock_extract:
+        second = scrape_eater_blog("https://test.eater.com/test-article")
+    mock_extract.assert_not_called()
+    assert second == first
+    assert mock_save.call_count == 2
+    mock_save.assert_called_with(first)
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+def test_scrape_one_not_modified_uses_cache(sample_html):
+    """Test that a 304 response returns and saves the restaurants cached from the previous scrape."""
+    responses = iter([
+        httpx.Response(200, content=sample_html.encode(), headers={"ETag": '"abc"'}),
+        httpx.Response(304),
+    ])
+    transport = httpx.MockTransport(lambda request: next(responses))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await _scrape_one(client, "https://test.eater.com/test-article")
+            second = await _scrape_one(client, "https://test.eater.com/test-article")
+            return first, second
+
+    with patch("src.scrape.eater_blog.save_restaurants") as mock_save, \
+         patch("src.scrape.eater_blog._get_parse_pool", return_value=None):
+        first, second = asyncio.run(run())
+    assert second == first
+    assert mock_save.call_count == 2
+    mock_save.assert_called_with(first)
+
+def test_page_cache_evicts_least_recently_used(monkeypatch):
+    """Test that the page cache stays within its size limit, dropping the page used longest ago."""
+    monkeypatch.setattr(eater_blog, "_PAGE_CACHE_MAXSIZE", 2)
+    for url in ("https://a.test", "https://b.test"):
+        eater_blog.cache_restaurants(url, {}, url.encode(), [])
+    # A lookup marks a page as recently used
+    assert eater_blog.get_cached_restaurants("https://a.test", 200, b"https://a.test") == []
+    eater_blog.cache_restaurants("https://c.test", {}, b"https://c.test", [])
+    assert list(eater_blog._PAGE_CACHE) == ["https://a.test", "https://c.test"]
+
+def test_save_debug_html_only_when_enabled(tmp_path, monkeypatch):
+    """Test that the debug HTML dump is written only when EATER_DEBUG_HTML is set."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("EATER_DEBUG_HTML", raising=False)
+    save_debug_html(b"<html></html>")
+    assert not (tmp_path / "debug_response.html").exists()
+
+    monkeypatch.setenv("EATER_DEBUG_HTML", "1")
+    save_debug_html(b"<html></html>")
+    assert (tmp_path / "debug_response.html").read_bytes() == b"<html></html>"
+
+def test_save_restaurants_inserts_then_updates(mock_sqlite_env):
+    """Test that saving creates new restaurants and updates them by address on a rescrape."""
+    from src.database.database import Base, get_engine, get_db
+    from src.database import crud
+    Base.metadata.create_all(get_engine())
+    restaurant = ScrapedRestaurant(
+        name="Test Restaurant",
+        address="123 Test St",
+        description="Old description",
+        source="eater",
+        source_url="https://eater.com/test-restaurant#test-slug",
+    )
+    save_restaurants([restaurant])
+    save_restaurants([dataclasses.replace(restaurant, description="New description")])
+
+    with get_db() as db:
+        rows = crud.get_restaurants(db)
+        assert len(rows) == 1
+        assert rows[0].description == "New description"
+
+def test_save_restaurants_duplicate_address_in_page_falls_back_to_upsert(mock_sqlite_env):
+    """Test that a page listing one address twice rolls back the bulk insert and upserts instead."""
+    from src.database.database import Base, get_engine, get_db
+    from src.database import crud
+    Base.metadata.create_all(get_engine())
+    first = ScrapedRestaurant(
+        name="First Listing",
+        address="123 Test St",
+        description="First description",
+        source="eater",
+        source_url="https://eater.com/test-restaurant#first",
+    )
+    second = dataclasses.replace(first, name="Second Listing", description="Second description")
+    with patch("src.database.crud.bulk_upsert_restaurants", wraps=crud.bulk_upsert_restaurants) as mock_upsert:
+        save_restaurants([first, second])
+    mock_upsert.assert_called_once()
+
+    with get_db() as db:
+        rows = crud.get_restaurants(db)
+        assert [(r.name, r.description) for r in rows] == [("Second Listing", "Second description")]
+
+def test_save_restaurants_concurrent_insert_falls_back_to_upsert(mock_sqlite_env):
+    """Test that an address saved by another scrape after the prefetch is updated rather than failing."""
+    from src.database.database import Base, get_engine, get_db
+    from src.database import crud
+    Base.metadata.create_all(get_engine())
+    with get_db() as db:
+        crud.create_restaurant(db, {"name": "Old Name", "address": "123 Test St"})
+    restaurants = [
+        ScrapedRestaurant(name="New Name", address="123 Test St", description=None, source="eater", source_url=""),
+        ScrapedRestaurant(name="Other", address="456 Other St", description=None, source="eater", source_url=""),
+    ]
+    # The prefetch ran before the other scrape committed, so it saw no existing rows
+    with patch("src.database.crud.get_restaurant_ids_by_addresses", return_value={}):
+        save_restaurants(restaurants)
+
+    with get_db() as db:
+        rows = crud.get_restaurants(db)
+        assert sorted((r.id, r.name) for r in rows) == [(1, "New Name"), (2, "Other")]
 
 # Edge Cases and Error Tests
 
 def test_parse_json_ld_empty_script():
     """Test handling of empty JSON-LD script tag."""
     html = '<script type="application/ld+json"></script>'
-    soup = BeautifulSoup(html, 'html.parser')
-    result = parse_json_ld(soup)
+    result = parse_json_ld(html)
     assert result is None
 
 def test_parse_json_ld_invalid_json():
     """Test handling of invalid JSON in script tag."""
     html = '<script type="application/ld+json">{"invalid": json</script>'
-    soup = BeautifulSoup(html, 'html.parser')
-    result = parse_json_ld(soup)
+    result = parse_json_ld(html)
     assert result is None
 
 def test_get_restaurant_items_no_items():
     """Test handling of JSON-LD data with no restaurant items."""
     json_data = {"itemListElement": [{"item": {"@type": "NotARestaurant"}}]}
-    result = get_restaurant_items(json_data)
+    result = list(get_restaurant_items(json_data))
     assert len(result) == 0
 
 def test_extract_map_card_info_missing_data(sample_html):
     """Test handling of missing address or description in map card."""
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    tree = parse_html(sample_html.encode())
     restaurant = {"url": "nonexistent-slug"}
-    address, description = extract_map_card_info(soup, restaurant)
+    address, description = extract_map_card_info(index_map_cards(tree), restaurant)
+    assert address is None
+    assert description is None
+
+def test_extract_map_card_info_url_without_fragment(sample_html):
+    """Test that a URL with no fragment is not mistaken for a slug."""
+    tree = parse_html(sample_html.encode())
+    restaurant = {"url": "test-slug"}
+    address, description = extract_map_card_info(index_map_cards(tree), restaurant)
     assert address is None
     assert description is None
 
-@patch("requests.get")
+@patch("src.scrape.eater_blog._SESSION.get")
 def test_scrape_eater_blog_http_error(mock_get):
     """Test handling of HTTP errors during scraping."""
     mock_get.side_effect = requests.RequestException("Test error")
     with pytest.raises(requests.RequestException):
         scrape_eater_blog("https://test.eater.com/test-article")
 
-@patch("requests.get")
-def test_scrape_eater_blog_retry_success(mock_get, mock_response, mock_sessionlocal):
-    """Test successful retry after initial failure."""
-    mock_get.side_effect = [
-        requests.RequestException("Test error"),
-        mock_response
-    ]
-    mock_db = Mock()
-    mock_sessionlocal.return_value = Mock()
-    mock_sessionlocal.return_value.return_value = mock_db
-    mock_db.query.return_value.filter.return_value.first.return_value = None
+def test_scrape_eater_blog_session_retries_transient_failures():
+    """Test that the shared session retries connection errors and throttled/5xx responses."""
+    adapter = _SESSION.get_adapter("https://test.eater.com/test-article")
+    assert _SESSION.get_adapter("http://test.eater.com/test-article") is adapter
+    retries = adapter.max_retries
+    assert retries.total == 3
+    assert retries.backoff_factor > 0
+    for status in (429, 500, 502, 503, 504):
+        assert retries.is_retry("GET", status)
+    assert not retries.is_retry("GET", 404)
 
-    result = scrape_eater_blog("https://test.eater.com/test-article")
+def _scrape_one_with_statuses(statuses, sample_html):
+    """Run _scrape_one without backoff against responses with the given statuses; return the result and request count."""
+    statuses = iter(statuses)
+    requests_made = []
+
+    def handler(request):
+        requests_made.append(request)
+        return httpx.Response(next(statuses), content=sample_html.encode())
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await _scrape_one.retry_with(wait=wait_none())(client, "https://test.eater.com/test-article")
+
+    with patch("src.scrape.eater_blog.save_restaurants"), \
+         patch("src.scrape.eater_blog._get_parse_pool", return_value=None):
+        return asyncio.run(run()), len(requests_made)
+
+def test_scrape_one_retries_server_errors(sample_html):
+    """Test that the async scrape retries a 503 and succeeds on the next attempt."""
+    result, attempts = _scrape_one_with_statuses([503, 200], sample_html)
+    assert attempts == 2
+    assert len(result) == 1
+
+def test_scrape_one_does_not_retry_client_errors(sample_html):
+    """Test that a 404 fails straight away instead of being fetched again."""
+    with pytest.raises(httpx.HTTPStatusError):
+        _scrape_one_with_statuses([404, 200], sample_html)
+
+def test_scrape_one_does_not_retry_parse_errors(sample_html):
+    """Test that an error while parsing is not retried."""
+    with patch("src.scrape.eater_blog.extract_restaurant_data", side_effect=ValueError("bad page")) as mock_extract:
+        with pytest.raises(ValueError):
+            _scrape_one_with_statuses([200, 200], sample_html)
+    mock_extract.assert_called_once()
+
+
+def test_scrape_one_replaces_broken_parse_pool(sample_html):
+    """Test that a parse pool broken by a dead worker is discarded and the page parsed in a fresh pool."""
+    broken = Mock(spec=concurrent.futures.ProcessPoolExecutor)
+    broken.submit.side_effect = BrokenProcessPool("worker died")
+    eater_blog._PARSE_POOL = broken
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=sample_html.encode()))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await _scrape_one(client, "https://test.eater.com/test-article")
+
+    with patch("src.scrape.eater_blog.save_restaurants"):
+        result = asyncio.run(run())
     assert len(result) == 1
-    assert mock_get.call_count == 2  # Verify retry happened 
+    broken.shutdown.assert_called_once()
+    assert eater_blog._PARSE_POOL is not None
+    assert eater_blog._PARSE_POOL is not broken
+
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
+def test_scrape_eater_blogs_concurrently_shuts_down_parse_pool(mock_scrape_single):
+    """Test that the parse pool's worker processes are stopped once a run finishes."""
+    pool = Mock(spec=concurrent.futures.ProcessPoolExecutor)
+    eater_blog._PARSE_POOL = pool
+    mock_scrape_single.return_value = []
+    scrape_eater_blogs_concurrently(["https://test.eater.com/url1"])
+    pool.shutdown.assert_called_once()
+    assert eater_blog._PARSE_POOL is None
 
 
 # Concurrent Scraping Tests
 
-@patch("src.scrape.eater_blog.scrape_eater_blog")
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
 def test_scrape_eater_blogs_concurrently_success(mock_scrape_single):
     """Test successful concurrent scraping of multiple URLs."""
     # Mock successful results for each URL
@@ -200,10 +500,10 @@ def test_scrape_eater_blogs_concurrently_success(mock_scrape_single):
     
     # Verify each URL was called
     assert mock_scrape_single.call_count == 3
-    called_urls = [call[0][0] for call in mock_scrape_single.call_args_list]
+    called_urls = [call[0][1] for call in mock_scrape_single.call_args_list]
     assert set(called_urls) == set(urls)
 
-@patch("src.scrape.eater_blog.scrape_eater_blog")
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
 def test_scrape_eater_blogs_concurrently_with_failures(mock_scrape_single):
     """Test concurrent scraping when some URLs fail."""
     # Mock mixed success and failure results
@@ -225,15 +525,15 @@ def test_scrape_eater_blogs_concurrently_with_failures(mock_scrape_single):
     # Verify all URLs were attempted
     assert mock_scrape_single.call_count == 3
 
-@patch("src.scrape.eater_blog.scrape_eater_blog")
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
 def test_scrape_eater_blogs_concurrently_empty_list(mock_scrape_single):
     """Test concurrent scraping with empty URL list."""
     scrape_eater_blogs_concurrently([])
     
-    # Should not call scrape_eater_blog at all
+    # Should not call _scrape_one at all
     assert mock_scrape_single.call_count == 0
 
-@patch("src.scrape.eater_blog.scrape_eater_blog")
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
 def test_scrape_eater_blogs_concurrently_single_url(mock_scrape_single):
     """Test concurrent scraping with single URL."""
     mock_scrape_single.return_value = [{"name": "Solo Restaurant", "address": "Solo Address"}]
@@ -243,9 +543,9 @@ def test_scrape_eater_blogs_concurrently_single_url(mock_scrape_single):
     scrape_eater_blogs_concurrently(urls, max_workers=1)
     
     assert mock_scrape_single.call_count == 1
-    assert mock_scrape_single.call_args[0][0] == urls[0]
+    assert mock_scrape_single.call_args[0][1] == urls[0]
 
-@patch("src.scrape.eater_blog.scrape_eater_blog")
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
 def test_scrape_eater_blogs_concurrently_custom_max_workers(mock_scrape_single):
     """Test concurrent scraping with custom max_workers parameter."""
     mock_scrape_single.side_effect = [
@@ -260,7 +560,27 @@ def test_scrape_eater_blogs_concurrently_custom_max_workers(mock_scrape_single):
     
     assert mock_scrape_single.call_count == 10
 
-@patch("src.scrape.eater_blog.scrape_eater_blog")
+@patch("src.scrape.eater_blog._scrape_one")
+def test_scrape_eater_blogs_concurrently_respects_max_workers(mock_scrape_single):
+    """Test that no more than max_workers URLs are scraped at the same time."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_scrape(client, url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    mock_scrape_single.side_effect = fake_scrape
+    scrape_eater_blogs_concurrently([f"https://test.eater.com/url{i}" for i in range(10)], max_workers=3)
+
+    assert mock_scrape_single.call_count == 10
+    assert peak == 3
+
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock)
 @patch("src.scrape.eater_blog.logger")
 def test_scrape_eater_blogs_concurrently_logs_results(mock_logger, mock_scrape_single):
     """Test that concurrent scraping logs success and failure messages."""
@@ -285,7 +605,7 @@ def test_scrape_eater_blogs_concurrently_logs_results(mock_logger, mock_scrape_s
     error_logged = any("generated an exception" in str(call) for call in error_calls)
     assert error_logged
 
-@patch("src.scrape.eater_blog.scrape_eater_blog") 
+@patch("src.scrape.eater_blog._scrape_one", new_callable=AsyncMock) 
 def test_scrape_eater_blogs_concurrently_all_failures(mock_scrape_single):
     """Test concurrent scraping when all URLs fail."""
     mock_scrape_single.side_effect = [
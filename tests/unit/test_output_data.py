@@ -0,0 +1,35 @@
+import pytest
+
+from src.scrape.eater_blog import ScrapedRestaurant, extract_restaurant_data
+from src.utils import output_data
+from src.utils.output_data import save_to_tsv
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """Point save_to_tsv's project root at a temp directory and return where it writes."""
+    monkeypatch.setattr(output_data, "__file__", str(tmp_path / "utils" / "output_data.py"))
+    return tmp_path / "resources" / "eater"
+
+def test_save_to_tsv_quotes_only_when_needed(output_dir):
+    """Test that the TSV matches the format pandas wrote: bare fields, quoting only around tabs/quotes/newlines."""
+    restaurants = [
+        ScrapedRestaurant(name="Plain", address="1 Main St", description=None, source="eater", source_url=""),
+        ScrapedRestaurant(name='Say "Hi"', address="2 Main St", description="Tab\there", source="eater", source_url=""),
+    ]
+    save_to_tsv(restaurants, "out.tsv")
+    assert (output_dir / "out.tsv").read_text() == (
+        "name\tdescription\tsource\tsource_url\taddress\n"
+        "Plain\t\teater\t\t1 Main St\n"
+        '"Say ""Hi"""\t"Tab\there"\teater\t\t2 Main St\n'
+    )
+
+def test_save_to_tsv_writes_scraper_output(output_dir, sample_html):
+    """Test saving the records extract_restaurant_data returns."""
+    restaurants = extract_restaurant_data(sample_html, "https://eater.com/test-article")
+    save_to_tsv(restaurants, "out.tsv")
+    assert (output_dir / "out.tsv").read_text() == (
+        "name\tdescription\tsource\tsource_url\taddress\n"
+        "Test Restaurant\tA fantastic test restaurant.\teater\t"
+        "https://eater.com/test-restaurant#test-slug\t123 Test St, Test City, TC 12345\n"
+    )